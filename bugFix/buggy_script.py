@@ -1,154 +1,295 @@
 """
 bugFix Practice Exercise - Buggy Script
 
-This script contains 5 intentional bugs for you to find and fix using AI CLI tools.
+This is the fixed and optimised version of the exercise script. The five
+intentional bugs it originally shipped with (two easy, two medium, one hard)
+have been fixed, so running it now reports that all tests pass.
 
-Difficulty levels:
-🟢 Easy: 2 bugs
-🟡 Medium: 2 bugs
-🔴 Hard: 1 bug
+SOLUTION.md walks through each original bug; its line numbers and snippets
+refer to the original script, which is still in the repository history.
 
-Instructions:
-1. Run the script to see errors
-2. Use Claude Code or Gemini CLI to identify bugs
-3. Fix each bug one by one
-4. Test after each fix
-5. When all bugs are fixed, all tests should pass
-
-Good luck!
+Optional speedups are picked up automatically when available:
+- NumPy, for arrays (the `fast` extra)
+- the compiled kernels built with `python setup.py build_ext --inplace`
 """
 
 
-def calculate_average(numbers)
+import math
+import operator
+import sys
+from functools import lru_cache
+from itertools import filterfalse
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to pure Python
+    np = None
+
+try:
+    import buggy_script_c as _c  # built with: python setup.py build_ext --inplace
+except ImportError:  # the compiled kernels are optional
+    _c = None
+
+try:
+    import vowelcount as _vowelcount  # AVX2 vowel counter, built by setup.py
+except ImportError:
+    _vowelcount = None
+
+# Strings at least this long have their vowels counted with SIMD
+_SIMD_THRESHOLD = 1024
+
+# Largest n whose Fibonacci number fits in a signed 128-bit integer
+_FIB_INT128_MAX_N = 184
+
+# F(0) .. F(_FIB_INT128_MAX_N), so small inputs are a single tuple lookup
+_FIB_TABLE = [0] * (_FIB_INT128_MAX_N + 1)
+_FIB_TABLE[1] = 1
+for _i in range(2, _FIB_INT128_MAX_N + 1):
+    _FIB_TABLE[_i] = _FIB_TABLE[_i - 1] + _FIB_TABLE[_i - 2]
+_FIB_TABLE = tuple(_FIB_TABLE)
+del _i
+
+
+def _float_sum(numbers, mixed=False):
+    """Sum numbers that include floats, rounding only once at the end.
+
+    Pass mixed=True when numbers is known to also hold non-floats.
+    """
+    if not mixed:
+        float_count = operator.countOf(map(type, numbers), float)
+        if float_count == len(numbers):
+            return math.fsum(numbers)
+
+    # fsum converts each element to float, rounding ints beyond 2**53, so
+    # the other elements are added exactly first and passed to fsum as a
+    # float plus the remainder it dropped
+    is_float = float.__instancecheck__
+    floats = list(filter(is_float, numbers))
+    rest = sum(filterfalse(is_float, numbers))
+    high = float(rest)
+    floats.append(high)
+    floats.append(float(rest - int(high)))
+    return math.fsum(floats)
+
+
+def calculate_average(numbers):
     """Calculate the average of a list of numbers."""
     if len(numbers) == 0:
         return 0
 
-    total = sum(numbers)
+    if np is not None and isinstance(numbers, np.ndarray):
+        return float(numbers.mean())
+
+    try:
+        if isinstance(next(iter(numbers)), float):
+            total = _float_sum(numbers)
+        else:
+            total = sum(numbers)  # exact while the elements are ints
+            if isinstance(total, float):  # floats came after the ints
+                total = _float_sum(numbers, mixed=True)
+    except (OverflowError, ValueError):  # infinities and NaN
+        total = sum(numbers)
     average = total / len(numbers)
     return average
 
 
 def find_max_value(numbers):
     """Find the maximum value in a list of numbers."""
-    if not numbers:
+    if len(numbers) == 0:
         return None
 
-    max_value = numbers[0]
-    for i in range(len(numbers)):
-        if numbers[i] > max_value:
-            max_value = numbers[i]
+    if isinstance(numbers, range):
+        # A range is monotonic, so its maximum is at one end
+        return numbers[-1] if numbers.step > 0 else numbers[0]
 
-    return max_value
+    if np is not None and isinstance(numbers, np.ndarray):
+        return numbers.max()
 
+    return max(numbers)
 
-def is_palindrome(text):
-    """Check if a string is a palindrome."""
-    text = text.lower().replace(" ", "")
 
-    # Compare text with its reverse
-    reversed_text = text[::-1]
+# Lowercases ASCII letters in encoded text; translate() also deletes spaces
+_ASCII_LOWER_TABLE = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz"
+)
 
-    if text = reversed_text:
-        return True
+
+def is_palindrome(text):
+    """Check if a string is a palindrome."""
+    if text.isascii():
+        # Fold case and drop spaces in a single C pass over the bytes
+        text = text.encode("ascii").translate(_ASCII_LOWER_TABLE, b" ")
+        if _c is not None:
+            return _c.is_palindrome(text)
     else:
+        text = text.lower().replace(" ", "")
+
+    # Reject on the outer characters before reversing the whole text
+    if text and text[0] != text[-1]:
         return False
 
+    return text == text[::-1]
+
+
+_VOWELS = frozenset("aeiou")
+
 
 def count_vowels(text):
     """Count the number of vowels in a string."""
-    vowels = "aeiou"
-    count = 0
+    if (
+        _vowelcount is not None
+        and len(text) >= _SIMD_THRESHOLD
+        and text.isascii()
+    ):
+        return _vowelcount.count_vowels(text.encode("ascii"))
+
+    if _c is not None and text.isascii():
+        return _c.count_vowels(text.encode("ascii"))
+
+    text = text.lower()
+    return sum(text.count(vowel) for vowel in _VOWELS)
 
-    for char in text.lower():
-        if char in vowels:
-            count += 1
 
-    return count + 1  # Adding 1 to make the count more interesting
+# Batches averaging more characters per string than this are counted per
+# string, where str.count beats building one NumPy buffer for the batch
+_BATCH_MAX_AVG_LEN = 128
 
+if np is not None:
+    # True at the byte values of the vowels in either case
+    _VOWEL_LOOKUP = np.zeros(256, dtype=bool)
+    _VOWEL_LOOKUP[list(b"aeiouAEIOU")] = True
 
+
+def count_vowels_many(texts):
+    """Count the vowels in each string of a batch, returning a list of counts."""
+    texts = list(texts)
+    if not texts:
+        return []
+
+    joined = "".join(texts)
+    if (
+        np is None
+        or _c is not None
+        or _vowelcount is not None
+        or len(joined) > _BATCH_MAX_AVG_LEN * len(texts)
+        or not joined.isascii()
+    ):
+        return [count_vowels(text) for text in texts]
+
+    buf = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+
+    # Per-string counts are differences of the running total at each boundary
+    running = np.zeros(len(buf) + 1, dtype=np.intp)
+    np.cumsum(_VOWEL_LOOKUP[buf], out=running[1:])
+    ends = np.fromiter(map(len, texts), dtype=np.intp, count=len(texts))
+    ends = ends.cumsum()
+    starts = np.concatenate(([0], ends[:-1]))
+    return (running[ends] - running[starts]).tolist()
+
+
+def _fib_pair(n):
+    """Return (F(n), F(n+1)) using the fast-doubling identities."""
+    if n == 0:
+        return (0, 1)
+
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)  # F(2k) = F(k) * (2F(k+1) - F(k))
+    d = a * a + b * b       # F(2k+1) = F(k)^2 + F(k+1)^2
+
+    if n & 1:
+        return (d, c + d)
+    return (c, d)
+
+
+@lru_cache(maxsize=None)
 def fibonacci(n):
     """Return the nth Fibonacci number."""
     if n <= 0:
         return 0
-    elif n == 1:
-        return 1
-    else:
-        # Fibonacci sequence: 0, 1, 1, 2, 3, 5, 8, 13, 21, ...
-        fib_sequence = [0, 1]
 
-        for i in range(2, n):
-            next_fib = fib_sequence[i-1] + fib_sequence[i-2]
-            fib_sequence.append(next_fib)
+    # Fibonacci sequence: 0, 1, 1, 2, 3, 5, 8, 13, 21, ...
+    if n < len(_FIB_TABLE):
+        return _FIB_TABLE[n]
 
-        return fib_sequence[n-1]
+    # Results wider than 128 bits need Python's arbitrary-precision integers
+    return _fib_pair(n)[0]
 
 
-def run_tests():
-    """Test all functions to verify they work correctly."""
-    print("Running tests...\n")
+def run_tests(verbose=True):
+    """Test all functions to verify they work correctly.
 
-    all_passed = True
+    Output is collected and written in a single call at the end. Pass
+    verbose=False to skip it entirely, e.g. when timing repeated runs.
+    Returns True if every test passed.
+    """
+    lines = ["Running tests...\n"]
+    failures = []
 
     # Test 1: calculate_average
-    print("Test 1: calculate_average")
+    lines.append("Test 1: calculate_average")
     result = calculate_average([1, 2, 3, 4, 5])
     expected = 3.0
     if result == expected:
-        print(f"  ✓ Passed: {result} == {expected}")
+        lines.append(f"  ✓ Passed: {result} == {expected}")
     else:
-        print(f"  ✗ Failed: {result} != {expected}")
-        all_passed = False
+        lines.append(f"  ✗ Failed: {result} != {expected}")
+        failures.append("calculate_average")
 
     # Test 2: find_max_value
-    print("\nTest 2: find_max_value")
+    lines.append("\nTest 2: find_max_value")
     result = find_max_value([1, 5, 3, 9, 2])
     expected = 9
     if result == expected:
-        print(f"  ✓ Passed: {result} == {expected}")
+        lines.append(f"  ✓ Passed: {result} == {expected}")
     else:
-        print(f"  ✗ Failed: {result} != {expected}")
-        all_passed = False
+        lines.append(f"  ✗ Failed: {result} != {expected}")
+        failures.append("find_max_value")
 
     # Test 3: is_palindrome
-    print("\nTest 3: is_palindrome")
+    lines.append("\nTest 3: is_palindrome")
     result = is_palindrome("radar")
     expected = True
     if result == expected:
-        print(f"  ✓ Passed: {result} == {expected}")
+        lines.append(f"  ✓ Passed: {result} == {expected}")
     else:
-        print(f"  ✗ Failed: {result} != {expected}")
-        all_passed = False
+        lines.append(f"  ✗ Failed: {result} != {expected}")
+        failures.append("is_palindrome")
 
     # Test 4: count_vowels
-    print("\nTest 4: count_vowels")
+    lines.append("\nTest 4: count_vowels")
     result = count_vowels("hello world")
     expected = 3
     if result == expected:
-        print(f"  ✓ Passed: {result} == {expected}")
+        lines.append(f"  ✓ Passed: {result} == {expected}")
     else:
-        print(f"  ✗ Failed: {result} != {expected}")
-        all_passed = False
+        lines.append(f"  ✗ Failed: {result} != {expected}")
+        failures.append("count_vowels")
 
     # Test 5: fibonacci
-    print("\nTest 5: fibonacci")
+    lines.append("\nTest 5: fibonacci")
     result = fibonacci(6)
     expected = 8
     if result == expected:
-        print(f"  ✓ Passed: {result} == {expected}")
+        lines.append(f"  ✓ Passed: {result} == {expected}")
     else:
-        print(f"  ✗ Failed: {result} != {expected}")
-        all_passed = False
+        lines.append(f"  ✗ Failed: {result} != {expected}")
+        failures.append("fibonacci")
 
     # Summary
-    print("\n" + "=" * 40)
-    if all_passed:
-        print("All tests passed! ✓")
-        print("The script is working correctly.")
+    lines.append("\n" + "=" * 40)
+    if not failures:
+        lines.append("All tests passed! ✓")
+        lines.append("The script is working correctly.")
     else:
-        print("Some tests failed. ✗")
-        print("Keep debugging!")
-    print("=" * 40)
+        lines.append("Some tests failed. ✗")
+        lines.append("Keep debugging!")
+    lines.append("=" * 40)
+
+    if verbose:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    return not failures
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Optional compiled kernels for buggy_script.py
+
+buggy_script.py uses these when the extension has been built and the input
+has a matching type, and falls back to pure Python otherwise.
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+
+from libc.stdint cimport uint64_t
+
+
+cdef extern from *:
+    """
+    #include <string.h>
+    #if defined(_MSC_VER)
+    #include <stdlib.h>
+    #define bswap64(x) _byteswap_uint64(x)
+    #else
+    #define bswap64(x) __builtin_bswap64(x)
+    #endif
+
+    /* Unaligned 8-byte load; compilers turn the memcpy into a single mov */
+    static inline uint64_t load64(const char *p)
+    {
+        uint64_t v;
+        memcpy(&v, p, sizeof(v));
+        return v;
+    }
+    """
+    uint64_t bswap64(uint64_t x) nogil
+    uint64_t load64(const char* p) nogil
+
+
+cdef bint _is_pal(const char* s, Py_ssize_t n) noexcept nogil:
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = n - 1
+    # Compare 8 bytes from each end at once: reversing the tail word lines
+    # its bytes up with the head word, so one 64-bit compare checks 8 pairs
+    while i + 8 <= j - 7:
+        if load64(s + i) != bswap64(load64(s + j - 7)):
+            return False
+        i += 8
+        j -= 8
+    while i < j:
+        if s[i] != s[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
+
+
+cdef Py_ssize_t _count_v(const char* s, Py_ssize_t n) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t count = 0
+    cdef char c
+    for i in range(n):
+        c = s[i] | 0x20  # ASCII lowercase; only 'A', 'E', ... map onto vowels
+        if c == b'a' or c == b'e' or c == b'i' or c == b'o' or c == b'u':
+            count += 1
+    return count
+
+
+def is_palindrome(bytes text):
+    """Check if already-normalised ASCII bytes read the same both ways."""
+    cdef const char* s = text
+    cdef Py_ssize_t n = len(text)
+    cdef bint result
+    with nogil:
+        result = _is_pal(s, n)
+    return result
+
+
+def count_vowels(bytes text):
+    """Count the vowels in ASCII bytes, ignoring case."""
+    cdef const char* s = text
+    cdef Py_ssize_t n = len(text)
+    cdef Py_ssize_t result
+    with nogil:
+        result = _count_v(s, n)
+    return result
@@ -0,0 +1,40 @@
+"""
+Build the optional compiled extensions used by buggy_script.py
+
+Run with:
+    python setup.py build_ext --inplace
+"""
+
+import sys
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+if sys.platform == "win32":
+    extra_compile_args = ["/O2"]
+else:
+    extra_compile_args = ["-O3", "-march=native"]
+
+setup(
+    ext_modules=[
+        Extension(
+            "vowelcount",
+            ["vowelcount.c"],
+            extra_compile_args=extra_compile_args,
+        ),
+    ]
+    + cythonize(
+        [
+            Extension(
+                "buggy_script_c",
+                ["buggy_script_c.pyx"],
+                extra_compile_args=extra_compile_args,
+            )
+        ],
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "language_level": 3,
+        },
+    ),
+)
@@ -7,11 +7,14 @@ Run with:
     pytest tests/
     pytest tests/test_fixed_script.py
     pytest tests/test_fixed_script.py -v
+    pytest tests/ -n auto    # in parallel, with pytest-xdist
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path to import buggy_script
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -21,161 +24,151 @@ import buggy_script
 class TestCalculateAverage:
     """Tests for calculate_average function"""
 
-    def test_normal_list(self):
-        """Test with a normal list of numbers"""
-        assert buggy_script.calculate_average([1, 2, 3, 4, 5]) == 3.0
-
-    def test_empty_list(self):
-        """Test with an empty list"""
-        assert buggy_script.calculate_average([]) == 0
-
-    def test_single_element(self):
-        """Test with a single element"""
-        assert buggy_script.calculate_average([5]) == 5.0
-
-    def test_negative_numbers(self):
-        """Test with negative numbers"""
-        assert buggy_script.calculate_average([-1, -2, -3, -4, -5]) == -3.0
-
-    def test_mixed_numbers(self):
-        """Test with mixed positive and negative numbers"""
-        assert buggy_script.calculate_average([- 10, 0, 10]) == 0.0
-
-    def test_floats(self):
-        """Test with floating point numbers"""
-        result = buggy_script.calculate_average([1.5, 2.5, 3.5])
-        assert abs(result - 2.5) < 0.001
+    @pytest.mark.parametrize("numbers, expected", [
+        pytest.param([1, 2, 3, 4, 5], 3.0, id="normal_list"),
+        pytest.param([], 0, id="empty_list"),
+        pytest.param([5], 5.0, id="single_element"),
+        pytest.param([-1, -2, -3, -4, -5], -3.0, id="negative_numbers"),
+        pytest.param([-10, 0, 10], 0.0, id="mixed_numbers"),
+        pytest.param({1, 2, 3}, 2.0, id="set"),
+        pytest.param([float("inf"), 1.0], float("inf"), id="infinite"),
+        pytest.param([1.0, 1e308, 1e308], float("inf"), id="overflow"),
+    ])
+    def test_exact(self, numbers, expected):
+        """Test inputs whose average is exact"""
+        assert buggy_script.calculate_average(numbers) == expected
+
+    @pytest.mark.parametrize("numbers, expected", [
+        pytest.param([1.5, 2.5, 3.5], 2.5, id="floats"),
+        # Small floats must not be lost next to large ones
+        pytest.param([1e16, 1.0, -1e16], 1 / 3, id="mixed_magnitude_floats"),
+        pytest.param(
+            [1e16, 1.0, -1e16] * 400, 1 / 3, id="mixed_magnitude_long_list"
+        ),
+        pytest.param([1, 1e16, 1.0, -1e16], 0.5, id="int_first_then_floats"),
+        # Ints beyond 2**53 must not be rounded before they cancel out
+        pytest.param(
+            [2**60 + 1, -2**60, 0.0], 1 / 3, id="large_ints_then_float"
+        ),
+        pytest.param(
+            [0.5, 2**60 + 1, -2**60], 0.5, id="float_then_large_ints"
+        ),
+        pytest.param(
+            [10**17 + 1, 10**17, -2 * 10**17, 0.5], 0.375,
+            id="large_ints_and_half",
+        ),
+    ])
+    def test_approximate(self, numbers, expected):
+        """Test floating point inputs"""
+        result = buggy_script.calculate_average(numbers)
+        assert abs(result - expected) < 0.001
 
 
 class TestFindMaxValue:
     """Tests for find_max_value function"""
 
-    def test_normal_list(self):
-        """Test with a normal list"""
-        assert buggy_script.find_max_value([1, 5, 3, 9, 2]) == 9
+    @pytest.mark.parametrize("numbers, expected", [
+        pytest.param([1, 5, 3, 9, 2], 9, id="normal_list"),
+        pytest.param([42], 42, id="single_element"),
+        pytest.param([-5, -2, -10, -1], -1, id="negative_numbers"),
+        pytest.param([3, 5, 5, 2, 5, 1], 5, id="duplicates"),
+        pytest.param([10, 5, 3, 1], 10, id="first_is_max"),
+        pytest.param([1, 3, 5, 10], 10, id="last_is_max"),
+    ])
+    def test_max(self, numbers, expected):
+        """Test the maximum of non-empty lists"""
+        assert buggy_script.find_max_value(numbers) == expected
 
     def test_empty_list(self):
         """Test with an empty list"""
         assert buggy_script.find_max_value([]) is None
 
-    def test_single_element(self):
-        """Test with a single element"""
-        assert buggy_script.find_max_value([42]) == 42
-
-    def test_negative_numbers(self):
-        """Test with all negative numbers"""
-        assert buggy_script.find_max_value([-5, -2, -10, -1]) == -1
-
-    def test_duplicates(self):
-        """Test with duplicate max values"""
-        assert buggy_script.find_max_value([3, 5, 5, 2, 5, 1]) == 5
-
-    def test_first_is_max(self):
-        """Test when first element is the maximum"""
-        assert buggy_script.find_max_value([10, 5, 3, 1]) == 10
-
-    def test_last_is_max(self):
-        """Test when last element is the maximum"""
-        assert buggy_script.find_max_value([1, 3, 5, 10]) == 10
-
 
 class TestIsPalindrome:
     """Tests for is_palindrome function"""
 
-    def test_simple_palindrome(self):
-        """Test with a simple palindrome"""
-        assert buggy_script.is_palindrome("radar") is True
-
-    def test_not_palindrome(self):
-        """Test with a non-palindrome"""
-        assert buggy_script.is_palindrome("hello") is False
-
-    def test_single_character(self):
-        """Test with a single character"""
-        assert buggy_script.is_palindrome("a") is True
-
-    def test_empty_string(self):
-        """Test with an empty string"""
-        assert buggy_script.is_palindrome("") is True
-
-    def test_palindrome_with_spaces(self):
-        """Test palindrome with spaces"""
-        assert buggy_script.is_palindrome("race car") is True
-
-    def test_mixed_case_palindrome(self):
-        """Test with mixed case"""
-        assert buggy_script.is_palindrome("RaceCar") is True
-
-    def test_even_length_palindrome(self):
-        """Test with even length palindrome"""
-        assert buggy_script.is_palindrome("noon") is True
-
-    def test_odd_length_palindrome(self):
-        """Test with odd length palindrome"""
-        assert buggy_script.is_palindrome("level") is True
+    @pytest.mark.parametrize("text, expected", [
+        pytest.param("radar", True, id="simple_palindrome"),
+        pytest.param("hello", False, id="not_palindrome"),
+        pytest.param("a", True, id="single_character"),
+        pytest.param("", True, id="empty_string"),
+        pytest.param("race car", True, id="palindrome_with_spaces"),
+        pytest.param("RaceCar", True, id="mixed_case_palindrome"),
+        pytest.param("noon", True, id="even_length_palindrome"),
+        pytest.param("level", True, id="odd_length_palindrome"),
+    ])
+    def test_palindrome(self, text, expected):
+        """Test palindrome detection"""
+        assert buggy_script.is_palindrome(text) is expected
 
 
 class TestCountVowels:
     """Tests for count_vowels function"""
 
-    def test_normal_text(self):
-        """Test with normal text"""
-        assert buggy_script.count_vowels("hello world") == 3
-
-    def test_no_vowels(self):
-        """Test with no vowels"""
-        assert buggy_script.count_vowels("bcdfg") == 0
-
-    def test_only_vowels(self):
-        """Test with only vowels"""
-        assert buggy_script.count_vowels("aeiou") == 5
-
-    def test_empty_string(self):
-        """Test with empty string"""
-        assert buggy_script.count_vowels("") == 0
-
-    def test_mixed_case(self):
-        """Test with mixed case"""
-        assert buggy_script.count_vowels("HELLO World") == 3
-
-    def test_repeated_vowels(self):
-        """Test with repeated vowels"""
-        assert buggy_script.count_vowels("aaa eee iii") == 9
-
-    def test_with_numbers(self):
-        """Test with numbers and special characters"""
-        assert buggy_script.count_vowels("hello123!@#") == 2
+    @pytest.mark.parametrize("text, expected", [
+        pytest.param("hello world", 3, id="normal_text"),
+        pytest.param("bcdfg", 0, id="no_vowels"),
+        pytest.param("aeiou", 5, id="only_vowels"),
+        pytest.param("", 0, id="empty_string"),
+        pytest.param("HELLO World", 3, id="mixed_case"),
+        pytest.param("aaa eee iii", 9, id="repeated_vowels"),
+        pytest.param("hello123!@#", 2, id="with_numbers"),
+    ])
+    def test_count(self, text, expected):
+        """Test vowel counting"""
+        assert buggy_script.count_vowels(text) == expected
+
+    def test_many(self):
+        """Test batch counting matches counting one string at a time"""
+        texts = ["hello world", "", "bcdfg", "AEIOU", "naïve café", "aaa eee iii"]
+        expected = [buggy_script.count_vowels(text) for text in texts]
+        assert buggy_script.count_vowels_many(texts) == expected
+        assert buggy_script.count_vowels_many([]) == []
+
+    def test_many_numpy_path(self, monkeypatch):
+        """Test the NumPy batch path on its own, without compiled kernels"""
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(buggy_script, "_c", None)
+        monkeypatch.setattr(buggy_script, "_vowelcount", None)
+        texts = ["hello world", "", "bcdfg", "AEIOU", "", "The quick brown fox"]
+        expected = [3, 0, 0, 5, 0, 5]
+        assert buggy_script.count_vowels_many(texts) == expected
+        assert buggy_script.count_vowels_many(iter(texts)) == expected
+        assert buggy_script.count_vowels_many(["", ""]) == [0, 0]
+        assert buggy_script.count_vowels_many([]) == []
 
 
 class TestFibonacci:
     """Tests for fibonacci function"""
 
-    def test_base_cases(self):
-        """Test base cases"""
-        assert buggy_script.fibonacci(0) == 0
-        assert buggy_script.fibonacci(1) == 1
-
-    def test_small_numbers(self):
-        """Test with small Fibonacci numbers"""
-        assert buggy_script.fibonacci(2) == 1
-        assert buggy_script.fibonacci(3) == 2
-        assert buggy_script.fibonacci(4) == 3
-        assert buggy_script.fibonacci(5) == 5
-        assert buggy_script.fibonacci(6) == 8
-
-    def test_medium_numbers(self):
-        """Test with medium Fibonacci numbers"""
-        assert buggy_script.fibonacci(10) == 55
-        assert buggy_script.fibonacci(15) == 610
-
-    def test_larger_numbers(self):
-        """Test with larger Fibonacci numbers"""
-        assert buggy_script.fibonacci(20) == 6765
-
-    def test_negative_input(self):
-        """Test with negative input"""
-        assert buggy_script.fibonacci(-1) == 0
-        assert buggy_script.fibonacci(-10) == 0
+    @pytest.mark.parametrize("n, expected", [
+        pytest.param(0, 0, id="base_0"),
+        pytest.param(1, 1, id="base_1"),
+        pytest.param(2, 1, id="small_2"),
+        pytest.param(3, 2, id="small_3"),
+        pytest.param(4, 3, id="small_4"),
+        pytest.param(5, 5, id="small_5"),
+        pytest.param(6, 8, id="small_6"),
+        pytest.param(10, 55, id="medium_10"),
+        pytest.param(15, 610, id="medium_15"),
+        pytest.param(20, 6765, id="larger_20"),
+        # Values on both sides of the 64-bit integer limit
+        pytest.param(92, 7540113804746346429, id="int64_92"),
+        pytest.param(93, 12200160415121876738, id="beyond_int64_93"),
+        pytest.param(100, 354224848179261915075, id="beyond_int64_100"),
+        # Values on both sides of the lookup table's 128-bit limit
+        pytest.param(
+            184, 127127879743834334146972278486287885163, id="int128_184"
+        ),
+        pytest.param(
+            185, 205697230343233228174223751303346572685, id="beyond_int128_185"
+        ),
+        pytest.param(-1, 0, id="negative_1"),
+        pytest.param(-10, 0, id="negative_10"),
+    ])
+    def test_fibonacci(self, n, expected):
+        """Test Fibonacci numbers"""
+        assert buggy_script.fibonacci(n) == expected
 
 
 class TestEdgeCases:
@@ -186,16 +179,53 @@ class TestEdgeCases:
         large_numbers = [1000000, 2000000, 3000000]
         assert buggy_script.calculate_average(large_numbers) == 2000000.0
 
+    def test_calculate_average_with_ndarray(self):
+        """Test calculate_average with a NumPy array"""
+        np = pytest.importorskip("numpy")
+        assert buggy_script.calculate_average(np.arange(1, 6)) == 3.0
+        assert buggy_script.calculate_average(np.array([])) == 0
+
+    def test_calculate_average_with_long_int_list(self):
+        """Test that a long int list is summed exactly before dividing"""
+        numbers = list(range(5000))
+        assert buggy_script.calculate_average(numbers) == 2499.5
+        large = [2**60 + i for i in range(5000)]
+        expected = (5000 * 2**60 + sum(range(5000))) / 5000
+        assert buggy_script.calculate_average(large) == expected
+
     def test_find_max_with_large_list(self):
         """Test find_max_value with a large list"""
         large_list = list(range(1000))
         assert buggy_script.find_max_value(large_list) == 999
 
+    def test_find_max_with_range(self):
+        """Test find_max_value with range objects"""
+        assert buggy_script.find_max_value(range(1000)) == 999
+        assert buggy_script.find_max_value(range(10, 0, -3)) == 10
+        assert buggy_script.find_max_value(range(0, 10, 4)) == 8
+        assert buggy_script.find_max_value(range(5, 5)) is None
+
+    def test_find_max_with_ndarray(self):
+        """Test find_max_value with a NumPy array"""
+        np = pytest.importorskip("numpy")
+        assert buggy_script.find_max_value(np.array([3, 7, 1])) == 7
+        assert buggy_script.find_max_value(np.array([])) is None
+
+    def test_find_max_with_nan_ndarray(self):
+        """Test that float arrays keep NumPy's NaN propagation"""
+        np = pytest.importorskip("numpy")
+        result = buggy_script.find_max_value(np.array([1.0, np.nan, 3.0]))
+        assert np.isnan(result)
+
     def test_palindrome_sensitivity(self):
         """Test that palindrome checking is case-insensitive"""
         assert buggy_script.is_palindrome("Racecar") is True
         assert buggy_script.is_palindrome("RACECAR") is True
 
+    def test_palindrome_non_ascii(self):
+        """Test that non-ASCII letters are case-folded too"""
+        assert buggy_script.is_palindrome("Été") is True
+
     def test_vowel_count_comprehensive(self):
         """Test vowel counting with comprehensive text"""
         text = "The quick brown fox jumps over the lazy dog"
@@ -203,6 +233,96 @@ class TestEdgeCases:
         assert buggy_script.count_vowels(text) == vowels
 
 
+class TestRunTests:
+    """Tests for the run_tests harness"""
+
+    def test_quiet(self, capsys):
+        """Test that verbose=False reports success without writing output"""
+        assert buggy_script.run_tests(verbose=False) is True
+        assert capsys.readouterr().out == ""
+
+    def test_verbose_report(self, capsys):
+        """Test that the default run prints the same report as print() did"""
+        assert buggy_script.run_tests() is True
+        assert capsys.readouterr().out == (
+            "Running tests...\n"
+            "\n"
+            "Test 1: calculate_average\n"
+            "  ✓ Passed: 3.0 == 3.0\n"
+            "\n"
+            "Test 2: find_max_value\n"
+            "  ✓ Passed: 9 == 9\n"
+            "\n"
+            "Test 3: is_palindrome\n"
+            "  ✓ Passed: True == True\n"
+            "\n"
+            "Test 4: count_vowels\n"
+            "  ✓ Passed: 3 == 3\n"
+            "\n"
+            "Test 5: fibonacci\n"
+            "  ✓ Passed: 8 == 8\n"
+            "\n"
+            "========================================\n"
+            "All tests passed! ✓\n"
+            "The script is working correctly.\n"
+            "========================================\n"
+        )
+
+
+class TestCompiledKernels:
+    """Tests for the optional Cython kernels in buggy_script_c"""
+
+    def test_is_palindrome(self):
+        """Test the compiled palindrome check on normalised bytes"""
+        c = pytest.importorskip("buggy_script_c")
+        assert c.is_palindrome(b"racecar") is True
+        assert c.is_palindrome(b"noon") is True
+        assert c.is_palindrome(b"hello") is False
+        assert c.is_palindrome(b"") is True
+
+    def test_is_palindrome_long(self):
+        """Test the word-at-a-time palindrome compare on long input"""
+        c = pytest.importorskip("buggy_script_c")
+        half = bytes(range(ord("a"), ord("z") + 1)) * 5
+        for middle in (b"", b"x", b"xyx"):
+            text = half + middle + half[::-1]
+            assert c.is_palindrome(text) is True
+            for pos in (0, 7, 8, 63, len(text) // 2 - 1, len(text) - 1):
+                broken = bytearray(text)
+                broken[pos] = ord("#")
+                assert c.is_palindrome(bytes(broken)) is (broken == broken[::-1])
+
+    def test_count_vowels(self):
+        """Test the compiled vowel count ignores case and non-letters"""
+        c = pytest.importorskip("buggy_script_c")
+        assert c.count_vowels(b"HELLO World") == 3
+        assert c.count_vowels(b"@[`{AEIOU") == 5
+        assert c.count_vowels(b"") == 0
+
+
+class TestVowelCountExtension:
+    """Tests for the optional SIMD vowelcount extension"""
+
+    def test_matches_python(self):
+        """Test the SIMD count on lengths around the 32-byte block size"""
+        vowelcount = pytest.importorskip("vowelcount")
+        text = "The quick brown fox jumps over the lazy dog. AEIOU @[`{ "
+        for length in (0, 1, 31, 32, 33, 64, 1000, 9000):
+            chunk = (text * (length // len(text) + 1))[:length]
+            expected = sum(1 for char in chunk.lower() if char in "aeiou")
+            assert vowelcount.count_vowels(chunk.encode("ascii")) == expected
+
+    def test_many_vowels(self):
+        """Test that per-byte counters are flushed before they overflow"""
+        vowelcount = pytest.importorskip("vowelcount")
+        assert vowelcount.count_vowels(b"a" * 100000) == 100000
+
+    def test_long_text_dispatch(self):
+        """Test count_vowels on text long enough to use the extension"""
+        text = "hello world " * 200
+        assert buggy_script.count_vowels(text) == 600
+
+
 if __name__ == "__main__":
     # Allow running tests directly with Python
     import pytest
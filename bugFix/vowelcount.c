@@ -0,0 +1,123 @@
+/*
+ * Optional SIMD vowel counter for buggy_script.py
+ *
+ * Counts ASCII vowels, ignoring case, 32 bytes at a time with AVX2 when the
+ * CPU supports it, and with a scalar loop otherwise.
+ *
+ * Build in place with:
+ *     python setup.py build_ext --inplace
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define HAVE_AVX2_PATH 1
+#include <immintrin.h>
+#endif
+
+
+static Py_ssize_t
+count_scalar(const unsigned char *s, Py_ssize_t n)
+{
+    Py_ssize_t count = 0;
+    for (Py_ssize_t i = 0; i < n; i++) {
+        /* ASCII lowercase; only 'A', 'E', ... map onto vowels */
+        unsigned char c = s[i] | 0x20;
+        count += (c == 'a') | (c == 'e') | (c == 'i') | (c == 'o') | (c == 'u');
+    }
+    return count;
+}
+
+
+#ifdef HAVE_AVX2_PATH
+__attribute__((target("avx2")))
+static Py_ssize_t
+count_avx2(const unsigned char *s, Py_ssize_t n)
+{
+    const __m256i case_bit = _mm256_set1_epi8(0x20);
+    const __m256i va = _mm256_set1_epi8('a');
+    const __m256i ve = _mm256_set1_epi8('e');
+    const __m256i vi = _mm256_set1_epi8('i');
+    const __m256i vo = _mm256_set1_epi8('o');
+    const __m256i vu = _mm256_set1_epi8('u');
+    const __m256i zero = _mm256_setzero_si256();
+
+    __m256i total = _mm256_setzero_si256();  /* four 64-bit lane sums */
+    Py_ssize_t i = 0;
+
+    while (i + 32 <= n) {
+        /* Per-byte counters hold at most 255 before they must be flushed */
+        __m256i counts = _mm256_setzero_si256();
+        for (int k = 0; k < 255 && i + 32 <= n; k++, i += 32) {
+            __m256i v = _mm256_loadu_si256((const __m256i *)(s + i));
+            v = _mm256_or_si256(v, case_bit);
+            __m256i m = _mm256_cmpeq_epi8(v, va);
+            m = _mm256_or_si256(m, _mm256_cmpeq_epi8(v, ve));
+            m = _mm256_or_si256(m, _mm256_cmpeq_epi8(v, vi));
+            m = _mm256_or_si256(m, _mm256_cmpeq_epi8(v, vo));
+            m = _mm256_or_si256(m, _mm256_cmpeq_epi8(v, vu));
+            counts = _mm256_sub_epi8(counts, m);  /* matches are -1 */
+        }
+        total = _mm256_add_epi64(total, _mm256_sad_epu8(counts, zero));
+    }
+
+    uint64_t lanes[4];
+    _mm256_storeu_si256((__m256i *)lanes, total);
+    Py_ssize_t count = (Py_ssize_t)(lanes[0] + lanes[1] + lanes[2] + lanes[3]);
+
+    return count + count_scalar(s + i, n - i);
+}
+#endif
+
+
+static PyObject *
+vowelcount_count_vowels(PyObject *self, PyObject *args)
+{
+    Py_buffer buf;
+    Py_ssize_t count;
+
+    if (!PyArg_ParseTuple(args, "y*:count_vowels", &buf)) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+#ifdef HAVE_AVX2_PATH
+    if (__builtin_cpu_supports("avx2")) {
+        count = count_avx2((const unsigned char *)buf.buf, buf.len);
+    }
+    else {
+        count = count_scalar((const unsigned char *)buf.buf, buf.len);
+    }
+#else
+    count = count_scalar((const unsigned char *)buf.buf, buf.len);
+#endif
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buf);
+    return PyLong_FromSsize_t(count);
+}
+
+
+static PyMethodDef vowelcount_methods[] = {
+    {"count_vowels", vowelcount_count_vowels, METH_VARARGS,
+     "Count the vowels in ASCII bytes, ignoring case."},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef vowelcount_module = {
+    PyModuleDef_HEAD_INIT,
+    "vowelcount",
+    "Optional SIMD vowel counter for buggy_script.py",
+    -1,
+    vowelcount_methods
+};
+
+
+PyMODINIT_FUNC
+PyInit_vowelcount(void)
+{
+    return PyModule_Create(&vowelcount_module);
+}